@@ -1,13 +1,37 @@
 """Module providing classes for MCMS commands"""
-
+import operator
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple, Union
 
 from mcms.enums import BlockChange, BlockHandling, Coordinate
 from mcms.utils import format_coordinates, format_state, format_tags
 
 
+def _read_only(name: str) -> property:
+    """Read-only property for the field stored in the private slot _<name>"""
+    return property(operator.attrgetter(f"_{name}"), doc=f"{name} (read-only)")
+
+def _read_only_mapping(name: str) -> property:
+    """Read-only property for the dictionary stored in the private slot _<name>"""
+    getter = operator.attrgetter(f"_{name}")
+
+    def get(self):
+        value = getter(self)
+        return MappingProxyType(value) if value is not None else None
+
+    return property(get, doc=f"{name} (read-only)")
+
 class StringCommand:
-    """Base class for commands with string representation"""
+    """Base class for commands with string representation
+
+    Commands are immutable after construction: subclasses compose the command text
+    on the first get_command_text call and cache it. Fields are read-only properties,
+    assigning them raises AttributeError. The state and tags dictionaries are copied
+    on construction and exposed as read-only mappings (nested tag values are not copied),
+    create a new command to send a different one.
+    """
+    __slots__ = ("_command_text", "_cached")
+
     def __init__(self, command_text: str):
         """String command
 
@@ -15,6 +39,7 @@ class StringCommand:
             command_text (str): Text of the command
         """
         self._command_text = command_text
+        self._cached = None
 
     def __str__(self):
         return f"{__class__.__name__}: {self.get_command_text()}"
@@ -31,7 +56,13 @@ class StringCommand:
         return " ".join([str(v) for v in args if v is not None])
 
 class ClearCommand(StringCommand):
-    """Class for clear command"""
+    """Class for clear command (immutable after construction, see StringCommand)"""
+    __slots__ = ("_player_name", "_item_name", "_amount")
+
+    player_name = _read_only("player_name")
+    item_name = _read_only("item_name")
+    amount = _read_only("amount")
+
     def __init__(self,
                  player_name: str,
                  item_name: Optional[str] = None,
@@ -44,19 +75,30 @@ class ClearCommand(StringCommand):
             Defaults to None (whole inventory).
             amount (int, optional): Max number to clear. Defaults to None.
         """
-        self.player_name = player_name
-        self.item_name = item_name
-        self.amount = amount
+        self._player_name = player_name
+        self._item_name = item_name
+        self._amount = amount
         super().__init__(None)
 
     def get_command_text(self) -> str:
-        command = f"clear {self.player_name}"
-        command = self._compose_command(command, self.item_name, self.amount)
+        if self._cached is not None:
+            return self._cached
+
+        command = f"clear {self._player_name}"
+        command = self._compose_command(command, self._item_name, self._amount)
 
+        self._cached = command
         return command
 
 class GiveCommand(StringCommand):
-    """Class for give command"""
+    """Class for give command (immutable after construction, see StringCommand)"""
+    __slots__ = ("_player_name", "_item_name", "_amount", "_tags")
+
+    player_name = _read_only("player_name")
+    item_name = _read_only("item_name")
+    amount = _read_only("amount")
+    tags = _read_only_mapping("tags")
+
     def __init__(self,
                  player_name: str,
                  item_name: str,
@@ -70,24 +112,36 @@ class GiveCommand(StringCommand):
             amount (int, optional): Number of items to give. Defaults to 1.
             tags (Dict[str, Any], optional): Components dictionary. Defaults to None.
         """
-        self.player_name = player_name
-        self.item_name = item_name
-        self.amount = amount
-        self.tags = tags
+        self._player_name = player_name
+        self._item_name = item_name
+        self._amount = amount
+        self._tags = dict(tags) if tags is not None else None
 
         super().__init__(None)
 
     def get_command_text(self) -> str:
-        command = f"give {self.player_name} {self.item_name}"
-        if self.tags is not None:
-            command += format_tags(self.tags)
-        if self.amount > 1:
-            command += f" {self.amount}"
+        if self._cached is not None:
+            return self._cached
 
-        return command
+        tags = format_tags(self._tags) if self._tags is not None else ""
+        amount = f" {self._amount}" if self._amount > 1 else ""
+
+        self._cached = f"give {self._player_name} {self._item_name}{tags}{amount}"
+        return self._cached
 
 class SetBlockCommand(StringCommand):
-    """Class for setblock command"""
+    """Class for setblock command (immutable after construction, see StringCommand)"""
+    __slots__ = ("_x", "_y", "_z", "_block_name", "_coordinate", "_change", "_state", "_tags")
+
+    x = _read_only("x")
+    y = _read_only("y")
+    z = _read_only("z")
+    block_name = _read_only("block_name")
+    coordinate = _read_only("coordinate")
+    change = _read_only("change")
+    state = _read_only_mapping("state")
+    tags = _read_only_mapping("tags")
+
     def __init__(self,
                  x: Union[int, Tuple[str, int]],
                  y: Union[int, Tuple[str, int]],
@@ -109,34 +163,45 @@ class SetBlockCommand(StringCommand):
             state (Optional[Dict[str, Any]], optional): State dictionary. Defaults to None.
             tags (Optional[Dict[str, Any]], optional): NBT-data dictionary. Defaults to None.
         """
-        self.x = x
-        self.y = y
-        self.z = z
-        self.block_name = block_name
-        self.coordinate = coordinate
-        self.change = change
-        self.state = state
-        self.tags = tags
+        self._x = x
+        self._y = y
+        self._z = z
+        self._block_name = block_name
+        self._coordinate = coordinate
+        self._change = change
+        self._state = dict(state) if state is not None else None
+        self._tags = dict(tags) if tags is not None else None
 
         super().__init__(None)
 
     def get_command_text(self) -> str:
-        coordinates = format_coordinates(self.x, self.y, self.z, self.coordinate)
-        command = f"setblock {coordinates} {self.block_name}"
-
-        if self.state is not None:
-            command += format_state(self.state)
+        if self._cached is not None:
+            return self._cached
 
-        if self.tags is not None:
-            command += format_tags(self.tags)
+        coordinates = format_coordinates(self._x, self._y, self._z, self._coordinate)
+        # State and tags are attached to the block name without a separator
+        state = format_state(self._state) if self._state is not None else ""
+        tags = format_tags(self._tags) if self._tags is not None else ""
+        change = f" {self._change}" if self._change != BlockChange.REPLACE else ""
 
-        if self.change != BlockChange.REPLACE:
-            command += f" {self.change}"
-
-        return command
+        self._cached = f"setblock {coordinates} {self._block_name}{state}{tags}{change}"
+        return self._cached
 
 class FillCommand(StringCommand):
-    """Class for fill command"""
+    """Class for fill command (immutable after construction, see StringCommand)"""
+    __slots__ = ("_x1", "_y1", "_z1", "_x2", "_y2", "_z2", "_block_name", "_coordinate", "_block_handling", "_replace_block_name")
+
+    x1 = _read_only("x1")
+    y1 = _read_only("y1")
+    z1 = _read_only("z1")
+    x2 = _read_only("x2")
+    y2 = _read_only("y2")
+    z2 = _read_only("z2")
+    block_name = _read_only("block_name")
+    coordinate = _read_only("coordinate")
+    block_handling = _read_only("block_handling")
+    replace_block_name = _read_only("replace_block_name")
+
     def __init__(self,
                  x1: Union[int, Tuple[str, int]],
                  y1: Union[int, Tuple[str, int]],
@@ -162,36 +227,50 @@ class FillCommand(StringCommand):
             block_handling (BlockHandling, optional): Type of the block handling. Defaults to None.
             replace_block_name (Optional[str], optional): Replace block name. Defaults to None.
         """
-        self.x1 = x1
-        self.y1 = y1
-        self.z1 = z1
-        self.x2 = x2
-        self.y2 = y2
-        self.z2 = z2
-        self.block_name = block_name
-        self.coordinate = coordinate
-        self.block_handling = block_handling
-        self.replace_block_name = replace_block_name
+        self._x1 = x1
+        self._y1 = y1
+        self._z1 = z1
+        self._x2 = x2
+        self._y2 = y2
+        self._z2 = z2
+        self._block_name = block_name
+        self._coordinate = coordinate
+        self._block_handling = block_handling
+        self._replace_block_name = replace_block_name
 
         super().__init__(None)
 
     def get_command_text(self) -> str:
-        coordinates_start = format_coordinates(self.x1, self.y1, self.z1, self.coordinate)
-        coordinates_end = format_coordinates(self.x2, self.y2, self.z2, self.coordinate)
-        command = f"fill {coordinates_start} {coordinates_end} {self.block_name}"
-
-        if self.block_handling is not None:
-            command += f" {self.block_handling}"
-            if self.block_handling == BlockHandling.REPLACE:
-                if self.replace_block_name is None:
+        if self._cached is not None:
+            return self._cached
+
+        handling = ""
+        if self._block_handling is not None:
+            if self._block_handling == BlockHandling.REPLACE:
+                if self._replace_block_name is None:
                     msg = "replace_block_name must be specified if block_handling is 'replace'"
                     raise ValueError(msg)
-                command += f" {self.replace_block_name}"
+                handling = f" {self._block_handling} {self._replace_block_name}"
+            else:
+                handling = f" {self._block_handling}"
 
-        return command
+        coordinates_start = format_coordinates(self._x1, self._y1, self._z1, self._coordinate)
+        coordinates_end = format_coordinates(self._x2, self._y2, self._z2, self._coordinate)
+
+        self._cached = f"fill {coordinates_start} {coordinates_end} {self._block_name}{handling}"
+        return self._cached
 
 class SummonCommand(StringCommand):
-    """Class for summon command"""
+    """Class for summon command (immutable after construction, see StringCommand)"""
+    __slots__ = ("_entity_name", "_x", "_y", "_z", "_coordinate", "_tags")
+
+    entity_name = _read_only("entity_name")
+    x = _read_only("x")
+    y = _read_only("y")
+    z = _read_only("z")
+    coordinate = _read_only("coordinate")
+    tags = _read_only_mapping("tags")
+
     def __init__(self,
                  entity_name: str,
                  x: Optional[Union[int, Tuple[str, int]]] = None,
@@ -209,23 +288,24 @@ class SummonCommand(StringCommand):
             coordinate (Coordinate, optional): Type of the coordinate. Defaults to None.
             tags (Optional[Dict[str, Any]], optional): NBT-data dictionary. Defaults to None.
         """
-        self.entity_name = entity_name
-        self.x = x
-        self.y = y
-        self.z = z
-        self.coordinate = coordinate
-        self.tags = tags
+        self._entity_name = entity_name
+        self._x = x
+        self._y = y
+        self._z = z
+        self._coordinate = coordinate
+        self._tags = dict(tags) if tags is not None else None
 
         super().__init__(None)
 
     def get_command_text(self) -> str:
-        if self.x is not None and self.y is not None and self.z is not None:
-            coordinates = format_coordinates(self.x, self.y, self.z, self.coordinate)
-            command = f"summon {self.entity_name} {coordinates}"
-        else:
-            command = f"summon {self.entity_name}"
+        if self._cached is not None:
+            return self._cached
 
-        if self.tags is not None:
-            command += format_tags(self.tags)
+        coordinates = ""
+        if self._x is not None and self._y is not None and self._z is not None:
+            coordinates = f" {format_coordinates(self._x, self._y, self._z, self._coordinate)}"
+        # Tags are attached to the last token without a separator
+        tags = format_tags(self._tags) if self._tags is not None else ""
 
-        return command
+        self._cached = f"summon {self._entity_name}{coordinates}{tags}"
+        return self._cached
@@ -1,20 +1,95 @@
 """Connection to MCMS"""
 import base64
 import json
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from mcms.commands import StringCommand
 from mcms.data import Block, GetBlockResponse, Location, Player
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CommandInfo = Union[str, StringCommand, Tuple[str, str], Tuple[StringCommand, str]]
 
+# Default number of concurrent requests, matches the connection pool size of requests
+_DEFAULT_MAX_WORKERS = 10
+
+def _json_dumps(obj: Any) -> bytes:
+    """Dump object to compact ASCII JSON bytes
+
+    Non-ASCII characters are sent as \\uXXXX escapes, so the payload does not depend
+    on the charset the server uses to decode it. Objects orjson cannot encode,
+    NaN and infinity are dumped with the standard json module.
+
+    Args:
+        obj (Any): Object to dump
+
+    Returns:
+        bytes: JSON bytes
+    """
+    if orjson is not None:
+        # orjson rejects some objects json accepts (NumPy scalars, big ints, non-str keys),
+        # always emits UTF-8 and writes NaN and infinity as null.
+        # Use it only if it succeeds with plain ASCII output without nulls
+        try:
+            data = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if data.isascii() and b"null" not in data:
+                return data
+    return json.dumps(obj, separators=(",", ":")).encode("ascii")
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _command_text(command: Union[str, StringCommand]) -> str:
+    """Get the text of a command
+
+    Args:
+        command (Union[str, StringCommand]): Command string or StringCommand object.
+
+    Returns:
+        str: Command text.
+
+    Raises:
+        ValueError: If command is not of the expected types.
+    """
+    if isinstance(command, str):
+        return command
+    if isinstance(command, StringCommand):
+        return command.get_command_text()
+    msg = "Invalid command type"
+    raise ValueError(msg)
+
+def _command_to_dict(command: CommandInfo) -> Dict[str, str]:
+    """Convert a command to a dictionary
+
+    Args:
+        command (CommandInfo): Command to convert.
+
+    Returns:
+        Dict[str, str]: Dictionary with "commandText" and "playerName" keys.
+
+    Raises:
+        ValueError: If command is not of the expected types.
+    """
+    if isinstance(command, tuple):
+        # Command is a tuple of command and player name
+        return {"commandText": _command_text(command[0]), "playerName": command[1]}
+    return {"commandText": _command_text(command)}
+
 class Connection:
 
     """Connection to MCMS"""
 
-    def __init__(self, address: str, port: int, credentials: Optional[Tuple[str, str]] = None):
+    def __init__(self,
+                 address: str,
+                 port: int,
+                 credentials: Optional[Tuple[str, str]] = None,
+                 raw_json: bool = False):  # noqa: FBT001, FBT002
         """
         Initializes a new instance of the Connection class with the provided address and port.
 
@@ -25,21 +100,41 @@ class Connection:
                 This is optional and only needs to be provided if the server requires authentication.
                 The tuple should contain the username as the first element and the password as the second element.
                 Defaults to None, which means no authentication is used.
+            raw_json (bool, optional): Send requests as raw JSON (Content-Type: application/json)
+                instead of base64 encoded JSON. Use it only if the server accepts raw JSON.
+                Defaults to False.
 
         Example:
             >>> connection = Connection("localhost", 8000)
             >>> connection = Connection("localhost", 8000, ("Admin", "123"))
+            >>> with Connection("localhost", 8000) as connection:
+            ...     connection.execute_command("say hello world!")  # doctest: +SKIP
         """
         # Construct the connection string from the provided address and port
         self._connection_string = f"http://{address}:{port}"
-        # Store the credentials if provided, otherwise set it to None
-        self._credentials = credentials
+        # Keep a session to reuse HTTP connections (keep-alive) between requests.
+        # requests has a heavy import graph, so it is imported only when a connection is created
+        import requests
+
+        self._session = requests.Session()
+        self._session.auth = credentials
+        # Send JSON as is instead of base64 encoded JSON
+        self._raw_json = raw_json
+        if raw_json:
+            self._session.headers["Content-Type"] = "application/json"
 
     def __str__(self):
         return self._connection_string
 
-    def _encode_text(self, text: str) -> str:
-        return base64.b64encode(text.encode(encoding="utf-8")).decode()
+    def __enter__(self) -> "Connection":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the connection and release pooled HTTP connections"""
+        self._session.close()
 
     def _process_response(self, object_to_dump, url: str, timeout: int) -> Any:
         """
@@ -57,27 +152,46 @@ class Connection:
             Any: A JSON object in the response.
         """
         # Dump the object to JSON and encode it
-        # The object is converted to a JSON string and then encoded using base64
-        # to ensure that it can be sent as payload in the HTTP request
-        json_data = json.dumps(object_to_dump)
-        encoded_data = self._encode_text(json_data)
+        # The object is converted to compact ASCII JSON with \uXXXX escapes (with orjson if it is installed)
+        # and then encoded using base64 to ensure that it can be sent as payload in the HTTP request.
+        # Servers accepting raw JSON get the JSON bytes without base64 encoding.
+        # The payload is kept as bytes, requests sends it as is
+        json_data = _json_dumps(object_to_dump)
+        encoded_data = json_data if self._raw_json else base64.b64encode(json_data)
 
         # Send a POST request to the URL with the encoded data as payload
-        response = requests.post(
-            url, data=encoded_data, timeout=timeout, auth=self._credentials)
+        response = self._session.post(url, data=encoded_data, timeout=timeout)
 
         # Check if the response was successful
         response.raise_for_status()
 
         # Return JSON object in the response
-        return json.loads(response.text)
+        # Parse the raw body to skip decoding it into an intermediate str
+        return _json_loads(response.content)
+
+    def execute_command(self,
+                        command: CommandInfo,
+                        timeout: Optional[int] = 10) -> bool:
+        """Execute a single command
+
+        Same as execute_commands for a single command (see execute_commands for the supported command types).
+
+        Args:
+            command (CommandInfo): Command to execute.
+            timeout (Optional[int], optional): Request timeout in seconds. Defaults to 10.
+
+        Returns:
+            bool: Command result
+        """
+        return self.execute_commands([command], timeout)[0]
 
     def execute_commands(self,
-                          command: Union[CommandInfo, List[CommandInfo]],
+                          command: List[CommandInfo],
                           timeout: Optional[int] = 10) -> List[bool]:
-        """Execute a command or list of commands
+        """Execute a list of commands
 
-        This method sends a command or a list of commands to the Minecraft server.
+        This method sends a list of commands to the Minecraft server.
+        Use execute_command to send a single command.
         The command can be of type:
         - String: This is a simple command string.
         - StringCommand: This is a command string object (see StringCommand class).
@@ -89,69 +203,82 @@ class Connection:
           it was entered in the Minecraft server console by the specified player.
 
         Args:
-            command (Union[CommandInfo, List[CommandInfo]]): Command to execute.
+            command (List[CommandInfo]): List of commands to execute.
             timeout (Optional[int], optional): Request timeout in seconds. Defaults to 10.
 
         Returns:
             List[bool]: List of bool command results
+
+        Raises:
+            TypeError: If a single command is passed instead of a list (use execute_command).
         """
-        # Helper function to convert a command to a dictionary
-        def convert_to_dict(command: CommandInfo) -> Dict[str, str]:
-            """Convert a command to a dictionary
-
-            Args:
-                command (CommandInfo): Command to convert.
-
-            Returns:
-                Dict[str, str]: Dictionary with "commandText" and "playerName" keys.
-
-            Raises:
-                ValueError: If command is not of the expected types.
-            """
-            msg = "Invalid command type"
-            if isinstance(command, str):
-                # Command is a simple string
-                return {"commandText": command}
-            elif isinstance(command, StringCommand):
-                # Command is a StringCommand object
-                return {"commandText": command.get_command_text()}
-            elif isinstance(command, tuple):
-                # Command is a tuple
-                if isinstance(command[0], StringCommand):
-                    # First element of the tuple is a StringCommand object
-                    return {"commandText": command[0].get_command_text(), "playerName": command[1]}
-                elif isinstance(command[0], str):
-                    # First element of the tuple is a string
-                    return {"commandText": command[0], "playerName": command[1]}
-                else:
-                    raise ValueError(msg)
-            else:
-                raise ValueError(msg)
+        # A single command would be iterated item by item (a string character by character)
+        if isinstance(command, (str, StringCommand, tuple)):
+            msg = "execute_commands expects a list of commands, use execute_command for a single command"
+            raise TypeError(msg)
 
         # URL for the command execution endpoint
         url = f"{self._connection_string}/runCommand"
 
-        # Convert the command(s) to a list of dictionaries
-        commands_list = []
-        if isinstance(command, list):
-            # If the command is a list, iterate over each element and convert it to a dictionary
-            commands_list = [convert_to_dict(c) for c in command]
-        else:
-            # If the command is not a list, convert it to a dictionary
-            commands_list = [convert_to_dict(command)]
+        # Convert each command to a dictionary
+        commands_list = [_command_to_dict(c) for c in command]
 
-        # Send the command(s) to the server and return the response
+        # Send the commands to the server and return the response
         return self._process_response(commands_list, url, timeout)
 
+    def execute_many(self,
+                     batches: List[List[CommandInfo]],
+                     timeout: Optional[int] = 10,
+                     max_workers: Optional[int] = None) -> List[List[bool]]:
+        """Execute independent batches of commands concurrently
+
+        Each batch is sent as a separate execute_commands request from a thread pool,
+        so the network latency of the requests overlaps.
+        The order in which the server executes the batches is not guaranteed.
+
+        Args:
+            batches (List[List[CommandInfo]]): List of command lists (see execute_commands).
+            timeout (Optional[int], optional): Request timeout in seconds. Defaults to 10.
+            max_workers (Optional[int], optional): Maximum number of concurrent requests.
+                Defaults to None (up to 10 concurrent requests).
+
+        Returns:
+            List[List[bool]]: List of bool command results for each batch, in the order of the batches
+        """
+        if not batches:
+            return []
+
+        workers = min(len(batches), max_workers or _DEFAULT_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda batch: self.execute_commands(batch, timeout), batches))
+
+    def get_block(self,
+                  location: Location,
+                  timeout: Optional[int] = 10) -> GetBlockResponse:
+        """
+        Get block:
+        This method retrieves a single block from the Minecraft world.
+
+        Args:
+            location (Location): Location of the block
+            timeout (Optional[int], optional): Timeout in seconds. Defaults to 10.
+
+        Returns:
+            GetBlockResponse: Information about the retrieved block,
+                including its location, state, and inventory.
+        """
+        return self.get_blocks([location], timeout)[0]
+
     def get_blocks(self,
-                   location: Union[Location, List[Location]],
-                   timeout: Optional[int] = 10) -> Tuple[int, List[GetBlockResponse]]:
+                   location: List[Location],
+                   timeout: Optional[int] = 10) -> List[GetBlockResponse]:
         """
         Get blocks:
-        This method retrieves one or more blocks from the Minecraft world.
+        This method retrieves a list of blocks from the Minecraft world.
+        Use get_block to retrieve a single block.
 
         Args:
-            location (Union[Location, List[Location]]): Location or list of locations
+            location (List[Location]): List of locations
             timeout (Optional[int], optional): Timeout in seconds. Defaults to 10.
 
         Returns:
@@ -159,45 +286,63 @@ class Connection:
                 List of GetBlockResponse.
                 GetBlockResponse contains information about the retrieved block,
                 including its location, state, and inventory.
+
+        Raises:
+            TypeError: If a single location is passed instead of a list (use get_block).
         """
+        if isinstance(location, Location):
+            msg = "get_blocks expects a list of locations, use get_block for a single location"
+            raise TypeError(msg)
 
         # Prepare request
         # Construct the URL for the getBlock request
         url = f"{self._connection_string}/getBlock"
 
-        # If location is a single Location object, convert it to a list
-        block_request = location if isinstance(location, list) else [location]
-
-        # Convert each Location object in block_request to its request data representation
-        blocks_list = [item.to_request_data() for item in block_request]
+        # Convert each Location object to its request data representation
+        blocks_list = [item.to_request_data() for item in location]
 
         # Send the request and get the response
         block_response = self._process_response(blocks_list, url, timeout)
 
         # Join request and response
-        # Combine the request (Location) and response (Dict[str, Any]) into a list of tuples
-        # Each tuple contains the request (Location) and response (Dict[str, Any])
-        block_source = list(zip(block_request, block_response))
-
-        # Convert each tuple to a GetBlockResponse object
-        # Parse the response data and create GetBlockResponse objects
+        # Pair each request (Location) with its response (Dict[str, Any]) and
+        # parse the response data into GetBlockResponse objects.
         # GetBlockResponse contains information about the retrieved block,
         # including its location, state, and inventory.
-        result = [GetBlockResponse.from_request_response_data(source[0], source[1]) for source in block_source]
+        result = [GetBlockResponse.from_request_response_data(request, response)
+                  for request, response in zip(location, block_response)]
 
         # Return the list of GetBlockResponse objects
         return result
 
+    def set_block(self,
+                  block: Block,
+                  timeout: Optional[int] = 10
+                  ) -> Tuple[bool, str]:
+        """
+        Set block:
+        This method sets a single block in the Minecraft world.
+
+        Args:
+            block (Block): Block to set.
+            timeout (Optional[int], optional): Optional timeout in seconds. Defaults to 10.
+
+        Returns:
+            Tuple[bool, str]: (success, exception) of the set operation.
+        """
+        return self.set_blocks([block], timeout)[0]
+
     def set_blocks(self,
-                   blocks: Union[Block, List[Block]],
+                   blocks: List[Block],
                    timeout: Optional[int] = 10
                    ) -> List[Tuple[bool, str]]:
         """
         Set blocks:
-        This method sets one or more blocks in the Minecraft world.
+        This method sets a list of blocks in the Minecraft world.
+        Use set_block to set a single block.
 
         Args:
-            blocks (Union[Block, List[Block]]): Single block or list of blocks to set.
+            blocks (List[Block]): List of blocks to set.
             timeout (Optional[int], optional): Optional timeout in seconds. Defaults to 10.
 
         Returns:
@@ -205,16 +350,74 @@ class Connection:
             This list contains a tuple for each block that was set.
             The tuple contains a boolean value indicating whether the set operation was
             successful and a string representing any exception that occurred during the set operation.
+
+        Raises:
+            TypeError: If a single block is passed instead of a list (use set_block).
         """
+        if isinstance(blocks, Block):
+            msg = "set_blocks expects a list of blocks, use set_block for a single block"
+            raise TypeError(msg)
 
         # Construct the URL for the setBlock API endpoint
         url = f"{self._connection_string}/setBlock"
 
-        # Check if the blocks argument is a single block or a list of blocks
-        list_of_blocks = blocks if isinstance(blocks, list) else [blocks]
-
         # Convert each block in the list to the request data format
-        blocks_request = [b.to_request_data() for b in list_of_blocks]
+        blocks_request = [b.to_request_data() for b in blocks]
+
+        # Call the _process_response method to send the request and process the response
+        return self._process_response(blocks_request, url, timeout)
+
+    def set_blocks_bulk(self,
+                        world: str,
+                        xs: Sequence[float],
+                        ys: Sequence[float],
+                        zs: Sequence[float],
+                        block_ids: Sequence[int],
+                        name_table: Sequence[str],
+                        timeout: Optional[int] = 10
+                        ) -> List[Tuple[bool, str]]:
+        """
+        Set blocks in bulk:
+        This method sets many blocks in the Minecraft world from parallel sequences of coordinates
+        (lists, NumPy arrays, etc.) without creating Block and Location objects for each block.
+
+        Args:
+            world (str): Name of the world.
+            xs (Sequence[float]): x coordinates of the blocks.
+            ys (Sequence[float]): y coordinates of the blocks.
+            zs (Sequence[float]): z coordinates of the blocks.
+            block_ids (Sequence[int]): Index of the block data in name_table for each block.
+            name_table (Sequence[str]): Block data strings, e.g. "minecraft:stone" or "minecraft:chest[facing=west]".
+            timeout (Optional[int], optional): Optional timeout in seconds. Defaults to 10.
+
+        Returns:
+            List[Tuple[bool, str]]: List of (success, exception) in the same order as the blocks.
+
+        Raises:
+            ValueError: If the coordinate and block id sequences have different lengths.
+
+        Example:
+            >>> connection = Connection("localhost", 8000)
+            >>> connection.set_blocks_bulk("world", [0, 1], [64, 64], [0, 0], [0, 1],
+            ...                            ["minecraft:stone", "minecraft:dirt"])  # doctest: +SKIP
+        """
+        if not len(xs) == len(ys) == len(zs) == len(block_ids):
+            msg = "xs, ys, zs and block_ids must have the same length"
+            raise ValueError(msg)
+
+        # Construct the URL for the setBlock API endpoint
+        url = f"{self._connection_string}/setBlock"
+
+        # Build the request data in a single pass, same layout as Block.to_request_data
+        blocks_request = [{"locationData": {"worldName": world,
+                                            "x": float(x),
+                                            "y": float(y),
+                                            "z": float(z),
+                                            "yaw": 0.0,
+                                            "pitch": 0.0},
+                           "blockData": name_table[block_id],
+                           "items": []}
+                          for x, y, z, block_id in zip(xs, ys, zs, block_ids)]
 
         # Call the _process_response method to send the request and process the response
         return self._process_response(blocks_request, url, timeout)
@@ -1,12 +1,47 @@
 """Data classes for Minecraft"""
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from mcms.enums import Facing
 from mcms.utils import format_state, parse_block_data
 
+# Facing for each quarter of the yaw circle starting from south (yaw 0) clockwise
+_FACING_TABLE = (Facing.SOUTH, Facing.WEST, Facing.NORTH, Facing.EAST)
 
-@dataclass(kw_only=True)
+def _facing_for_yaw(yaw: float) -> Facing:
+    """Get facing for the yaw value
+
+    Args:
+        yaw (float): Yaw value
+
+    Returns:
+        Facing: Facing
+    """
+    # Yaw outside (-180, 180], NaN and infinity face north
+    if not -180 < yaw <= 180:
+        return Facing.NORTH
+    # Quarters are (-45, 45] south, (45, 135] west, (135, 180] or (-180, -135] north
+    # and (-135, -45] east.
+    # -((45 - yaw) // 90) is the ceiling of (yaw - 45) / 90, wrapped to the quarter index
+    return _FACING_TABLE[-int((45 - yaw) // 90) & 3]
+
+def classify_facings(yaws: Iterable[float]) -> List[Facing]:
+    """Get facing for many yaw values at once
+
+    Args:
+        yaws (Iterable[float]): Yaw values (list, NumPy array, etc.)
+
+    Returns:
+        List[Facing]: Facing for each yaw, same as Location.get_facing
+
+    Examples:
+        >>> classify_facings([0, 90, 180, -90])
+        [<Facing.SOUTH: 'south'>, <Facing.WEST: 'west'>, <Facing.NORTH: 'north'>, <Facing.EAST: 'east'>]
+    """
+    return list(map(_facing_for_yaw, yaws))
+
+@dataclass(kw_only=True, slots=True)
 class Location:
     """Minecraft location"""
     world: str = "world"
@@ -22,17 +57,7 @@ class Location:
         Returns:
             Facing: Facing
         """
-        levels = {
-            (-45, 45): Facing.SOUTH,
-            (45, 135): Facing.WEST,
-            (135, 180): Facing.NORTH,
-            (-180, -135):Facing.NORTH,
-            (-135, -45): Facing.EAST}
-
-        for borders, facing in levels.items():
-            if self.yaw > borders[0] and self.yaw <= borders[1]:
-                return facing
-        return Facing.NORTH
+        return _facing_for_yaw(self.yaw)
 
     def to_request_data(self) -> Dict[str, Any]:
         """Convert location to request data
@@ -65,7 +90,7 @@ class Location:
             yaw=data["yaw"],
             pitch=data["pitch"])
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NamespacedKey:
     """Minecraft namespaced key"""
     namespace: str = "minecraft"
@@ -83,7 +108,7 @@ class NamespacedKey:
         """
         return f"{self.namespace}:{self.name}"
 
-@dataclass
+@dataclass(slots=True)
 class Enchantment(NamespacedKey):
     """Minecraft enchantment"""
     level: int
@@ -109,11 +134,11 @@ class Enchantment(NamespacedKey):
             Enchantment: Enchantment
         """
         return cls(
-            namespace=data["nameSpace"],
-            name=data["key"],
+            namespace=sys.intern(data["nameSpace"]),
+            name=sys.intern(data["key"]),
             level=data["level"])
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemStack(NamespacedKey):
     """Minecraft item stack"""
     index: int = -1
@@ -127,8 +152,7 @@ class ItemStack(NamespacedKey):
             Dict[str, Any]: Request data dictionary
         """
         # enchantments
-        enchantments = [] if self.enchantments is None else [e.to_request_data()
-                                                             for e in self.enchantments]
+        enchantments = [e.to_request_data() for e in self.enchantments] if self.enchantments else []
 
         return {"materialKey": self.name,
                 "materialNameSpaceKey": self.namespace,
@@ -146,19 +170,21 @@ class ItemStack(NamespacedKey):
         Returns:
             ItemStack: Item stack
         """
-        enchantments = []
-        if "enchantments" in data:
-            enchantments = [Enchantment.from_request_data(enchantment)
-                            for enchantment in data["enchantments"]]
+        enchantments = data.get("enchantments")
+        enchantments = [Enchantment.from_request_data(enchantment)
+                        for enchantment in enchantments] if enchantments else []
 
         return cls(
-            name=data["materialKey"],
-            namespace=data["materialNameSpaceKey"],
+            name=sys.intern(data["materialKey"]),
+            namespace=sys.intern(data["materialNameSpaceKey"]),
             index=data["Index"],
             count=data["Count"],
             enchantments=enchantments)
 
-@dataclass
+# Bound reference used when parsing block inventories in bulk
+_item_stack_from_request_data = ItemStack.from_request_data
+
+@dataclass(slots=True)
 class Block(NamespacedKey):
     """Minecraft block"""
     location: Location
@@ -178,10 +204,7 @@ class Block(NamespacedKey):
             ... "west", "type": "single", "waterlogged": False}).get_block_data_as_string()
             'minecraft:chest[facing=west, type=single, waterlogged=False]'
         """
-        result = self.get_full_name()
-        if self.state is not None:
-            result += format_state(self.state)
-        return result
+        return f"{self.namespace}:{self.name}{format_state(self.state) if self.state else ''}"
 
     def to_request_data(self) -> Dict[str, Any]:
         """Convert block to request data
@@ -190,19 +213,17 @@ class Block(NamespacedKey):
             Dict[str, Any]: Request data dictionary
         """
         # Block data
-        block_data = f"{self.namespace}:{self.name}"
-        if self.state is not None:
-            block_data += format_state(self.state)
+        block_data = self.get_block_data_as_string()
 
         # items
-        items = [] if self.inventory is None else [i.to_request_data() for i in self.inventory]
+        items = [i.to_request_data() for i in self.inventory] if self.inventory else []
 
         # Location and block data
         return {"locationData": self.location.to_request_data(),
                 "blockData": block_data,
                 "items": items}
 
-@dataclass
+@dataclass(slots=True)
 class GetBlockResponse:
     """Get block response"""
     success: bool
@@ -221,29 +242,30 @@ class GetBlockResponse:
         Returns:
             GetBlockResponse: Get block response
         """
+        success = block_response["success"]
         block = None
-        if block_response["success"]:
+        if success:
             block_full_name, state = parse_block_data(block_response["result"])
-            parts = block_full_name.split(":", 2)
+            namespace, _, name = block_full_name.partition(":")
 
-            inventory = []
-            if "items" in block_response:
-                inventory = [ItemStack.from_request_data(item) for item in block_response["items"]]
+            items = block_response.get("items")
+            inventory = [_item_stack_from_request_data(item) for item in items] if items else []
 
+            # Namespaces and names repeat across blocks, share a single str object for each
             block = Block(
-                namespace=parts[0],
-                name=parts[1],
+                namespace=sys.intern(namespace),
+                name=sys.intern(name),
                 location=block_request,
                 state=state,
                 inventory=inventory)
 
         return cls(
-            success=block_response["success"],
+            success=success,
             exception=block_response.get("exception", None),
             result=block
         )
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Minecraft player"""
     name: str
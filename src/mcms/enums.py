@@ -1,17 +1,76 @@
 """Module providing enums for MCMS"""
+import sys
 from enum import Enum
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Type, TypeVar
 
+_E = TypeVar("_E", bound="_ValueLookup")
 
-class BlockChange(Enum):
+
+class _ValueLookup:
+    """Declaration of the value lookup that _value_lookup adds to the enum class"""
+    __slots__ = ()
+
+    _value_map: ClassVar[Mapping[str, Any]]
+
+    @classmethod
+    def from_value(cls: Type[_E], value: str) -> _E:
+        """Get the member with the value
+
+        Args:
+            value (str): Member value
+
+        Returns:
+            The member with the value
+
+        Raises:
+            KeyError: If there is no member with the value
+        """
+        # Replaced with the bound dictionary lookup by _value_lookup
+        return cls._value_map[value]
+
+
+def _value_lookup(enum_class):
+    """Add from_value lookup to the enum class
+
+    from_value(value) returns the member with the value (KeyError if there is none).
+    It is the bound __getitem__ of a plain dictionary, so it skips both the Enum metaclass
+    __call__ of enum_class(value) and any Python-level function call.
+    Member values are interned, so comparisons and dictionary lookups with them can short-circuit on identity.
+    The value map is read-only.
+
+    Args:
+        enum_class: Enum class to decorate
+
+    Returns:
+        The decorated enum class
+
+    Examples:
+        >>> Facing.from_value("west")
+        <Facing.WEST: 'west'>
+    """
+    for member in enum_class:
+        member._value_ = sys.intern(member._value_)
+    value_map = {member.value: member for member in enum_class}
+    enum_class._value_map = MappingProxyType(value_map)
+    enum_class.from_value = staticmethod(value_map.__getitem__)
+    return enum_class
+
+# Enums mix in str: each member is its own string value,
+# str() and f-strings use the C-level str methods instead of a Python-level __str__
+
+@_value_lookup
+class BlockChange(_ValueLookup, str, Enum):
     """Block change types"""
     REPLACE = "replace"
     DESTROY = "destroy"
     KEEP = "keep"
 
-    def __str__(self):
-        return self.value
+    __str__ = str.__str__
+    __format__ = str.__format__
 
-class BlockHandling(Enum):
+@_value_lookup
+class BlockHandling(_ValueLookup, str, Enum):
     """Block handling types"""
     HOLLOW = "hollow"
     OUTLINE = "outline"
@@ -19,24 +78,26 @@ class BlockHandling(Enum):
     DESTROY = "destroy"
     KEEP = "keep"
 
-    def __str__(self):
-        return self.value
+    __str__ = str.__str__
+    __format__ = str.__format__
 
-class Facing(Enum):
+@_value_lookup
+class Facing(_ValueLookup, str, Enum):
     """Block facing types"""
     NORTH = "north"
     SOUTH = "south"
     EAST = "east"
     WEST = "west"
 
-    def __str__(self):
-        return self.value
+    __str__ = str.__str__
+    __format__ = str.__format__
 
-class Coordinate(Enum):
+@_value_lookup
+class Coordinate(_ValueLookup, str, Enum):
     """Coordinate types"""
     ABSOLUTE = ""
     RELATIVE = "~"
     LOCAL = "^"
 
-    def __str__(self):
-        return self.value
+    __str__ = str.__str__
+    __format__ = str.__format__
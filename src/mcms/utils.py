@@ -1,9 +1,13 @@
 """Utils for MCMS"""
-import re
-from typing import Any, Dict, Tuple, Union
+import functools
+import sys
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from mcms.enums import Coordinate
 
+# Prefix of each coordinate type, a dictionary hit is cheaper than the Enum value descriptor
+_COORD_PREFIX = {coordinate: coordinate.value for coordinate in Coordinate}
+
 
 def format_state(state: Dict[str, Any]) -> str:
     """Format state dictionary
@@ -18,7 +22,37 @@ def format_state(state: Dict[str, Any]) -> str:
         >>> format_state({"string_value": "mystring", "int_value": 1, "bool_value": True})
         '[string_value=mystring, int_value=1, bool_value=True]'
     """
-    return "[" + ", ".join([f"{key}={value}" for key, value in state.items()]) + "]"
+    if len(state) == 1:
+        # Single property states skip the join
+        ((key, value),) = state.items()
+        return f"[{key}={value}]"
+    return f"[{', '.join([f'{key}={value}' for key, value in state.items()])}]"
+
+
+_TRUE_VALUES = frozenset(("true", "True", "TRUE"))
+_FALSE_VALUES = frozenset(("false", "False", "FALSE"))
+
+
+def _parse_primitive(value: str) -> Union[int, bool, str]:
+    """Parse state value to int, bool or str
+
+    Args:
+        value (str): State value
+
+    Returns:
+        Union[int, bool, str]: Parsed value
+    """
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    # int() also accepts digit group underscores ("1_0"), such values stay strings
+    if value and (value[0] == "-" or value[0].isdigit()) and "_" not in value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return value
 
 
 def parse_state(block_data: str) -> Dict[str, Any]:
@@ -34,25 +68,42 @@ def parse_state(block_data: str) -> Dict[str, Any]:
         >>> parse_state("minecraft:chest[string_value=mystring, int_value=1, bool_value=True]")
         {'string_value': 'mystring', 'int_value': 1, 'bool_value': True}
     """
-    def parse_primitive(value: str) -> Union[int, bool, str]:
-        if value.isdecimal() or value.isdigit():
-            return int(value)
-        elif value.lower() == "true":
-            return True
-        elif value.lower() == "false":
-            return False
-        else:
-            return value
+    start = block_data.find("[")
+    if start < 0:
+        return {}
+    return _parse_state_at(block_data, start)
+
+
+def _parse_state_at(block_data: str, start: int) -> Dict[str, Any]:
+    """Parse state data from string (block_data) with known opening bracket index
 
-    # get state
-    state_data = re.findall(r"\[(.*?)\]", block_data)
+    Args:
+        block_data (str): Block data to parse
+        start (int): Index of the opening square bracket
+
+    Returns:
+        Dict[str, Any]: State dictionary
+    """
+    # get state: text between the opening bracket and the next closing bracket.
+    # Keys come from a small vocabulary ("facing", "waterlogged", ...) and are interned,
+    # so all parsed states share the key objects and later lookups hit on identity
     state = {}
-    if len(state_data) == 0:
+    end = block_data.find("]", start + 1)
+    if end <= start + 1:
+        # No closing bracket or empty state
+        return state
+    body = block_data[start + 1:end]
+    if " " not in body:
+        # Server block data has no spaces ("facing=west,type=single"), no need to strip
+        for pair in body.split(","):
+            key, _, value = pair.partition("=")
+            state[sys.intern(key)] = _parse_primitive(value)
         return state
-    pairs = state_data[0].split(",")
-    for pair in pairs:
-        key, value = pair.split("=")
-        state[key.strip()] = parse_primitive(value.strip())
+
+    # Spaced block data ("facing=west, type=single") as produced by format_state
+    for pair in body.split(","):
+        key, _, value = pair.partition("=")
+        state[sys.intern(key.strip())] = _parse_primitive(value.strip())
     return state
 
 
@@ -69,12 +120,34 @@ def parse_block_data(block_data: str) -> Tuple[str, Dict[str, Any]]:
         >>> parse_block_data("minecraft:chest[facing=west,type=single,waterlogged=false]")
         ('minecraft:chest', {'facing': 'west', 'type': 'single', 'waterlogged': False})
     """
-    # get block name
-    namespace_data = block_data.split("[", 1)[0]
+    # Block data strings repeat a lot, parse each one once.
+    # The state is cached as immutable pairs, every call gets its own dictionary
+    namespace_data, state_items = _parse_block_data_cached(block_data)
+    return namespace_data, dict(state_items)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_block_data_cached(block_data: str) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    """Parse block data from string (block_data), cached
+
+    Args:
+        block_data (str): Block data to parse
+
+    Returns:
+        Tuple[str, Tuple[Tuple[str, Any], ...]]: Block namespace data and state (key, value) pairs
+    """
+    # Block name and state share a single scan for the opening bracket
+    start = block_data.find("[")
+    if start < 0:
+        return block_data, ()
+
+    state_data = _parse_state_at(block_data, start)
+    return block_data[:start], tuple(state_data.items())
+
 
-    # get state
-    state_data = parse_state(block_data)
-    return namespace_data, state_data
+def clear_block_data_cache():
+    """Clear the cache of parsed block data used by parse_block_data"""
+    _parse_block_data_cached.cache_clear()
 
 
 def format_tags(tags: Dict[str, Any]) -> str:
@@ -90,18 +163,73 @@ def format_tags(tags: Dict[str, Any]) -> str:
         >>> format_tags({"Enchantments": [{"id": "sharpness", "lvl": 999}, {"id": "unbreaking", "lvl": 999}]})
         '{Enchantments:[{id:"sharpness",lvl:999},{id:"unbreaking",lvl:999}]}'
     """
-    def format_type(value) -> str:
+    parts = []
+    _append_tag_value(parts, tags)
+    return "".join(parts)
+
+
+def _append_tag_value(parts: List[str], value: Any):
+    """Append formatted tag value tokens to parts
+
+    Args:
+        parts (List[str]): Tokens of the formatted tags
+        value (Any): Tag value to format
+    """
+    # Exact types are dispatched with a single dictionary lookup
+    append = _TAG_APPENDERS.get(type(value))
+    if append is None:
+        # Subclasses of the supported types
         if isinstance(value, dict):
-            return format_tags(value)
+            append = _append_tag_dict
         elif isinstance(value, list):
-            return "[" + ",".join([format_type(item) for item in value]) + "]"
+            append = _append_tag_list
         elif isinstance(value, str):
-            return f'"{value}"'
+            append = _append_tag_str
         else:
-            return str(value)
-    result = "{" + ",".join([f"{key}:{format_type(value)}" for key,
-                            value in tags.items()]) + "}"
-    return result
+            append = _append_tag_other
+    append(parts, value)
+
+
+def _append_tag_dict(parts: List[str], value: Dict[str, Any]):
+    parts.append("{")
+    for key, item in value.items():
+        parts.append(f"{key}:")
+        _append_tag_value(parts, item)
+        parts.append(",")
+    # Trailing separator becomes the closing bracket
+    if value:
+        parts[-1] = "}"
+    else:
+        parts.append("}")
+
+
+def _append_tag_list(parts: List[str], value: List[Any]):
+    parts.append("[")
+    for item in value:
+        _append_tag_value(parts, item)
+        parts.append(",")
+    if value:
+        parts[-1] = "]"
+    else:
+        parts.append("]")
+
+
+def _append_tag_str(parts: List[str], value: str):
+    parts.append(f'"{value}"')
+
+
+def _append_tag_other(parts: List[str], value: Any):
+    parts.append(str(value))
+
+
+_TAG_APPENDERS = {
+    dict: _append_tag_dict,
+    list: _append_tag_list,
+    str: _append_tag_str,
+    int: _append_tag_other,
+    float: _append_tag_other,
+    bool: _append_tag_other,
+}
 
 
 def format_coordinates(x: Union[int, Tuple[str, int]],
@@ -126,15 +254,38 @@ def format_coordinates(x: Union[int, Tuple[str, int]],
         >>> format_coordinates(196, 11, 57, Coordinate.RELATIVE)
         '~196 ~11 ~57'
     """
-    def format_single(x: Tuple[str, int]) -> str:
-        if isinstance(x, tuple):
-            if coordinate is not None:
-                return f"{coordinate}{x[1]}"
-            else:
-                return f"{x[0]}{x[1]}"
-        elif coordinate is not None:
-            return f"{coordinate}{x}"
-        else:
-            return str(x)
+    if coordinate is not None:
+        # Coordinate type overrides the prefix of every coordinate
+        prefix = _COORD_PREFIX[coordinate]
+        x = x[1] if isinstance(x, tuple) else x
+        y = y[1] if isinstance(y, tuple) else y
+        z = z[1] if isinstance(z, tuple) else z
+        return f"{prefix}{x} {prefix}{y} {prefix}{z}"
+
+    x = f"{x[0]}{x[1]}" if isinstance(x, tuple) else x
+    y = f"{y[0]}{y[1]}" if isinstance(y, tuple) else y
+    z = f"{z[0]}{z[1]}" if isinstance(z, tuple) else z
+    return f"{x} {y} {z}"
+
 
-    return f"{format_single(x)} {format_single(y)} {format_single(z)}"
+def format_coordinates_batch(xs: Iterable[int],
+                             ys: Iterable[int],
+                             zs: Iterable[int],
+                             coordinate: Coordinate = None) -> List[str]:
+    """Format many numeric coordinates at once
+
+    Args:
+        xs (Iterable[int]): X coordinates (list, NumPy array, etc.)
+        ys (Iterable[int]): Y coordinates (list, NumPy array, etc.)
+        zs (Iterable[int]): Z coordinates (list, NumPy array, etc.)
+        coordinate (Coordinate, optional): Coordinate type for all coordinates. Defaults to None (absolute).
+
+    Returns:
+        List[str]: Formatted coordinates, same as format_coordinates for each (x, y, z)
+
+    Examples:
+        >>> format_coordinates_batch([196, 0], [11, 70], [57, 161], Coordinate.RELATIVE)
+        ['~196 ~11 ~57', '~0 ~70 ~161']
+    """
+    prefix = "" if coordinate is None else _COORD_PREFIX[coordinate]
+    return [f"{prefix}{x} {prefix}{y} {prefix}{z}" for x, y, z in zip(xs, ys, zs)]